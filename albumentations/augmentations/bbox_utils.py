@@ -365,9 +365,7 @@ def filter_bboxes(bboxes, rows, cols, min_area=0.0, min_visibility=0.0):
         clipped_box_area = calculate_bbox_area(bbox, rows, cols)
         if not transformed_box_area or clipped_box_area / transformed_box_area <= min_visibility:
             continue
-        else:
-            bbox = tuple(np.clip(bbox[:4], 0, 1.0))
-        if calculate_bbox_area(bbox, rows, cols) <= min_area:
+        if clipped_box_area <= min_area:
             continue
         resulting_boxes.append(bbox + tail)
     return resulting_boxes
@@ -387,13 +385,14 @@ def union_of_bboxes(height, width, bboxes, erosion_rate=0.0, to_int=False):
         tuple: A bounding box `(x_min, y_min, x_max, y_max)`.
 
     """
-    x1, y1 = width, height
-    x2, y2 = 0, 0
-    for bbox in bboxes:
-        x_min, y_min, x_max, y_max = bbox[:4]
-        w, h = x_max - x_min, y_max - y_min
-        lim_x1, lim_y1 = x_min + erosion_rate * w, y_min + erosion_rate * h
-        lim_x2, lim_y2 = x_max - erosion_rate * w, y_max - erosion_rate * h
-        x1, y1 = np.min([x1, lim_x1]), np.min([y1, lim_y1])
-        x2, y2 = np.max([x2, lim_x2]), np.max([y2, lim_y2])
+    if len(bboxes) == 0:
+        return width, height, 0, 0
+
+    bboxes = np.array([bbox[:4] for bbox in bboxes], dtype=np.float64)
+    x_min, y_min, x_max, y_max = bboxes.T
+    w, h = x_max - x_min, y_max - y_min
+    x1 = min(width, np.min(x_min + erosion_rate * w))
+    y1 = min(height, np.min(y_min + erosion_rate * h))
+    x2 = max(0, np.max(x_max - erosion_rate * w))
+    y2 = max(0, np.max(y_max - erosion_rate * h))
     return x1, y1, x2, y2
@@ -29,7 +29,8 @@ def angle_2pi_range(func):
 
 
 def clip(img, dtype, maxval):
-    return np.clip(img, 0, maxval).astype(dtype)
+    # np.clip always returns a fresh array, so there is no need to copy it once more when dtype already matches
+    return np.clip(img, 0, maxval).astype(dtype, copy=False)
 
 
 def clipped(func):
@@ -52,7 +53,8 @@ def preserve_shape(func):
     def wrapped_function(img, *args, **kwargs):
         shape = img.shape
         result = func(img, *args, **kwargs)
-        result = result.reshape(shape)
+        if result.shape != shape:
+            result = result.reshape(shape)
         return result
 
     return wrapped_function
@@ -1381,7 +1383,13 @@ def to_float(img, max_value=None):
                 "Can't infer the maximum value for dtype {}. You need to specify the maximum value manually by "
                 "passing the max_value argument".format(img.dtype)
             )
-    return img.astype("float32") / max_value
+    img = img.astype("float32")
+    # astype always returns a copy, so it can be normalized in place instead of allocating another array,
+    # unless the division would promote the result to a wider dtype (e.g. for uint32 max values).
+    if np.result_type(img, max_value) != img.dtype:
+        return img / max_value
+    img /= max_value
+    return img
 
 
 def from_float(img, dtype, max_value=None):
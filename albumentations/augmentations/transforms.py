@@ -1076,14 +1076,15 @@ class CropNonEmptyMaskIfExists(DualTransform):
         mask = params["mask"]
         mask_height, mask_width = mask.shape[:2]
 
-        if self.ignore_values is not None:
-            ignore_values_np = np.array(self.ignore_values)
-            mask = np.where(np.isin(mask, ignore_values_np), 0, mask)
-
+        # Drop ignored channels first so that the value masking below only touches the channels that are kept
         if mask.ndim == 3 and self.ignore_channels is not None:
             target_channels = np.array([ch for ch in range(mask.shape[-1]) if ch not in self.ignore_channels])
             mask = np.take(mask, target_channels, axis=-1)
 
+        if self.ignore_values is not None:
+            ignore_values_np = np.array(self.ignore_values)
+            mask = np.where(np.isin(mask, ignore_values_np), 0, mask)
+
         if self.height > mask_height or self.width > mask_width:
             raise ValueError(
                 "Crop size ({},{}) is larger than image ({},{})".format(
@@ -1096,8 +1097,9 @@ class CropNonEmptyMaskIfExists(DualTransform):
             y_min = random.randint(0, mask_height - self.height)
         else:
             mask = mask.sum(axis=-1) if mask.ndim == 3 else mask
-            non_zero_yx = np.argwhere(mask)
-            y, x = random.choice(non_zero_yx)
+            # Pick a flat index instead of materializing an (N, 2) array of coordinates for every non-zero pixel
+            non_zero_indices = np.flatnonzero(mask)
+            y, x = divmod(non_zero_indices[random.randint(0, len(non_zero_indices) - 1)], mask_width)
             x_min = x - random.randint(0, self.width - 1)
             y_min = y - random.randint(0, self.height - 1)
             x_min = np.clip(x_min, 0, mask_width - self.width)
@@ -1364,39 +1366,40 @@ class RandomGridShuffle(DualTransform):
 
         random_state = np.random.RandomState(random.randint(0, 10000))
 
-        height_split = np.linspace(0, height, n + 1, dtype=np.int)
-        width_split = np.linspace(0, width, m + 1, dtype=np.int)
+        height_split = np.linspace(0, height, n + 1, dtype=np.int32)
+        width_split = np.linspace(0, width, m + 1, dtype=np.int32)
 
-        height_matrix, width_matrix = np.meshgrid(height_split, width_split, indexing="ij")
+        # Tile (i, j) starts at (height_split[i], width_split[j]), so every per-tile quantity can be derived
+        # from the 1-D splits without building meshgrids over the whole grid.
+        height_starts, width_starts = height_split[:-1], width_split[:-1]
+        height_tile_sizes, width_tile_sizes = np.diff(height_split), np.diff(width_split)
 
-        index_height_matrix = height_matrix[:-1, :-1]
-        index_width_matrix = width_matrix[:-1, :-1]
+        tiles_sizes = np.stack(np.broadcast_arrays(height_tile_sizes[:, None], width_tile_sizes[None, :]), axis=2)
 
-        shifted_index_height_matrix = height_matrix[1:, 1:]
-        shifted_index_width_matrix = width_matrix[1:, 1:]
-
-        height_tile_sizes = shifted_index_height_matrix - index_height_matrix
-        width_tile_sizes = shifted_index_width_matrix - index_width_matrix
-
-        tiles_sizes = np.stack((height_tile_sizes, width_tile_sizes), axis=2)
-
-        index_matrix = np.indices((n, m))
+        index_matrix = np.indices((n, m), dtype=np.int32)
         new_index_matrix = np.stack(index_matrix, axis=2)
 
-        for bbox_size in np.unique(tiles_sizes.reshape(-1, 2), axis=0):
-            eq_mat = np.all(tiles_sizes == bbox_size, axis=2)
-            new_index_matrix[eq_mat] = random_state.permutation(new_index_matrix[eq_mat])
+        # Group tiles of equal size with a single sort over packed (height << 32 | width) keys instead of rescanning
+        # the whole grid for every unique size. Groups come out in the same order as from np.unique, and a stable
+        # sort keeps tiles inside a group in raster order, so the permutations match a per-size boolean mask.
+        size_keys = (tiles_sizes[..., 0].astype(np.uint64) << np.uint64(32)) | tiles_sizes[..., 1].astype(np.uint64)
+        size_keys = size_keys.reshape(-1)
+        order = np.argsort(size_keys, kind="stable")
+        sorted_keys = size_keys[order]
+        group_starts = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
 
-        new_index_matrix = np.split(new_index_matrix, 2, axis=2)
+        flat_index_matrix = new_index_matrix.reshape(-1, 2)
+        for group in np.split(order, group_starts):
+            flat_index_matrix[group] = random_state.permutation(flat_index_matrix[group])
 
-        old_x = index_height_matrix[new_index_matrix[0], new_index_matrix[1]].reshape(-1)
-        old_y = index_width_matrix[new_index_matrix[0], new_index_matrix[1]].reshape(-1)
+        old_x = height_starts[new_index_matrix[..., 0]].reshape(-1)
+        old_y = width_starts[new_index_matrix[..., 1]].reshape(-1)
 
-        shift_x = height_tile_sizes.reshape(-1)
-        shift_y = width_tile_sizes.reshape(-1)
+        shift_x = np.repeat(height_tile_sizes, m)
+        shift_y = np.tile(width_tile_sizes, n)
 
-        curr_x = index_height_matrix.reshape(-1)
-        curr_y = index_width_matrix.reshape(-1)
+        curr_x = np.repeat(height_starts, m)
+        curr_y = np.tile(width_starts, n)
 
         tiles = np.stack([curr_x, curr_y, old_x, old_y, shift_x, shift_y], axis=1)
 
@@ -1476,18 +1479,17 @@ class Cutout(ImageOnlyTransform):
         img = params["image"]
         height, width = img.shape[:2]
 
-        holes = []
-        for _n in range(self.num_holes):
-            y = random.randint(0, height)
-            x = random.randint(0, width)
-
-            y1 = np.clip(y - self.max_h_size // 2, 0, height)
-            y2 = np.clip(y + self.max_h_size // 2, 0, height)
-            x1 = np.clip(x - self.max_w_size // 2, 0, width)
-            x2 = np.clip(x + self.max_w_size // 2, 0, width)
-            holes.append((x1, y1, x2, y2))
+        centers = [(random.randint(0, height), random.randint(0, width)) for _n in range(self.num_holes)]
+        y, x = np.array(centers, dtype=np.int64).reshape(-1, 2).T
 
-        return {"holes": holes}
+        # Clip all holes at once instead of calling np.clip for every coordinate of every hole
+        holes = np.stack(
+            [x - self.max_w_size // 2, y - self.max_h_size // 2, x + self.max_w_size // 2, y + self.max_h_size // 2],
+            axis=1,
+        )
+        holes = np.clip(holes, 0, [width, height, width, height])
+
+        return {"holes": [tuple(hole) for hole in holes]}
 
     @property
     def targets_as_params(self):
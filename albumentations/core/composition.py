@@ -77,16 +77,15 @@ class BaseCompose(object):
 
     def indented_repr(self, indent=REPR_INDENT_STEP):
         args = {k: v for k, v in self._to_dict().items() if not (k.startswith("__") or k == "transforms")}
-        repr_string = self.__class__.__name__ + "(["
+        lines = [self.__class__.__name__ + "(["]
         for t in self.transforms:
-            repr_string += "\n"
             if hasattr(t, "indented_repr"):
                 t_repr = t.indented_repr(indent + REPR_INDENT_STEP)
             else:
                 t_repr = repr(t)
-            repr_string += " " * indent + t_repr + ","
-        repr_string += "\n" + " " * (indent - REPR_INDENT_STEP) + "], {args})".format(args=format_args(args))
-        return repr_string
+            lines.append(" " * indent + t_repr + ",")
+        lines.append(" " * (indent - REPR_INDENT_STEP) + "], {args})".format(args=format_args(args)))
+        return "\n".join(lines)
 
     @classmethod
     def get_class_fullname(cls):
@@ -12,6 +12,7 @@ from albumentations.augmentations.bbox_utils import (
     convert_bbox_from_albumentations,
     convert_bboxes_to_albumentations,
     convert_bboxes_from_albumentations,
+    union_of_bboxes,
 )
 from albumentations.core.composition import Compose
 from albumentations.core.transforms_interface import NoOp
@@ -238,3 +239,16 @@ def test_random_rotate():
     aug = Rotate(limit=15, p=1.0)
     transformed = aug(image=image, bboxes=bboxes)
     assert len(bboxes) == len(transformed["bboxes"])
+
+
+@pytest.mark.parametrize(
+    ["bboxes", "erosion_rate", "expected"],
+    [
+        [[], 0.0, (1, 1, 0, 0)],
+        [[(0.1, 0.2, 0.5, 0.6, "label")], 0.0, (0.1, 0.2, 0.5, 0.6)],
+        [[(0.1, 0.2, 0.3, 0.4), (0.2, 0.1, 0.6, 0.5, 1)], 0.0, (0.1, 0.1, 0.6, 0.5)],
+        [[(0.1, 0.2, 0.3, 0.4), (0.2, 0.1, 0.6, 0.5)], 0.5, (0.2, 0.3, 0.4, 0.3)],
+    ],
+)
+def test_union_of_bboxes(bboxes, erosion_rate, expected):
+    assert np.allclose(union_of_bboxes(1, 1, bboxes, erosion_rate=erosion_rate), expected)
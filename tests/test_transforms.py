@@ -564,3 +564,16 @@ def test_mask_dropout():
     result = aug(image=img, mask=mask)
     assert np.all(result["image"] == img)
     assert np.all(result["mask"] == 0)
+
+
+@pytest.mark.parametrize("grid", [(1, 1), (2, 5), (3, 3), (3, 2), (4, 7)])
+def test_random_grid_shuffle_swaps_only_equal_tiles(grid):
+    image = np.zeros((10, 15, 3), dtype=np.uint8)
+    aug = A.RandomGridShuffle(grid=grid, p=1)
+    tiles = aug.get_params_dependent_on_targets({"image": image})["tiles"]
+
+    assert len(tiles) == grid[0] * grid[1]
+    tile_sizes = {(curr_x, curr_y): (shift_x, shift_y) for curr_x, curr_y, _, _, shift_x, shift_y in tiles}
+    assert sorted(tile_sizes) == sorted((old_x, old_y) for _, _, old_x, old_y, _, _ in tiles)
+    for _, _, old_x, old_y, shift_x, shift_y in tiles:
+        assert tile_sizes[(old_x, old_y)] == (shift_x, shift_y)